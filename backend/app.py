@@ -1,15 +1,67 @@
-from flask import Flask, jsonify, request, send_from_directory
+from flask import Flask, jsonify, request, send_from_directory, Response
 from flask_cors import CORS
 import os
 import json
 import traceback
+# orjson serializes the large nested forecast payloads several times faster
+# than the stdlib and handles NumPy scalars natively; fall back gracefully
+# where it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
 # Import the fixed weather forecast module
-from weather_forecast_fixed import run_forecast
+from weather_forecast_fixed import run_forecast, load_and_train
 
 # Initialize Flask app
 app = Flask(__name__, static_folder='../frontend/build')
 CORS(app)  # Enable CORS for all routes
 
+# Process-level cache for forecast results. Training the models dominates
+# request time, so repeated requests for the same parameters should not pay
+# that cost again. Entries are keyed by (data.csv mtime, days, start_date),
+# so editing the data file automatically invalidates stale results, and each
+# entry stores the response pre-serialized so cache hits skip jsonify too.
+_FORECAST_CACHE = {}
+_FORECAST_CACHE_MAX_ENTRIES = 32
+
+def serialize_response(payload):
+    """Serialize a response dict to JSON bytes, preferring orjson."""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(payload).encode('utf-8')
+
+def get_cached_forecast(data_path, days, start_date):
+    """Run the forecast, caching results per (data mtime, days, start_date).
+
+    Returns (forecast_results, serialized_response, success, message).
+    """
+    cache_key = (os.stat(data_path).st_mtime_ns, days, start_date)
+    cached = _FORECAST_CACHE.get(cache_key)
+    if cached is not None:
+        forecast_results, serialized = cached
+        return forecast_results, serialized, True, "Forecast served from cache"
+
+    forecast_results, success, message = run_forecast(data_path, days, start_date)
+
+    if not success or forecast_results is None:
+        return None, None, False, message
+
+    # Serialize once so cache hits can bypass jsonify entirely
+    serialized = serialize_response({
+        "success": True,
+        "message": message,
+        "data": forecast_results
+    })
+
+    # Keep the cache bounded; dropping everything is fine since entries
+    # are cheap to rebuild relative to how rarely this should trigger
+    if len(_FORECAST_CACHE) >= _FORECAST_CACHE_MAX_ENTRIES:
+        _FORECAST_CACHE.clear()
+    _FORECAST_CACHE[cache_key] = (forecast_results, serialized)
+
+    return forecast_results, serialized, True, message
+
 # Define API routes
 @app.route('/api/forecast', methods=['GET'])
 def get_forecast():
@@ -19,28 +71,24 @@ def get_forecast():
         days = request.args.get('days', default=90, type=int)
         start_date = request.args.get('start_date', default=None, type=str)
         data_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data.csv")
-        
+
         if not os.path.exists(data_path):
             return jsonify({
                 "success": False,
                 "message": f"Data file not found: {data_path}"
             }), 404
-        
+
         # Run the enhanced forecast with the start_date if provided
-        forecast_results, success, message = run_forecast(data_path, days, start_date)
-        
-        if success and forecast_results is not None:
-            return jsonify({
-                "success": True,
-                "message": message,
-                "data": forecast_results
-            })
+        forecast_results, serialized, success, message = get_cached_forecast(data_path, days, start_date)
+
+        if success and serialized is not None:
+            return Response(serialized, mimetype='application/json')
         else:
             return jsonify({
                 "success": False,
                 "message": message
             }), 500
-    
+
     except Exception as e:
         traceback_str = traceback.format_exc()
         print(f"Error: {str(e)}\n{traceback_str}")
@@ -61,14 +109,24 @@ def get_model_info():
                 "message": f"Data file not found: {data_path}"
             }), 404
         
-        # Run forecast and extract model information
-        forecast_results, success, message = run_forecast(data_path, days=7)  # Only need a short forecast for model info
-        
-        if success and forecast_results is not None:
+        # Train-only path: model info doesn't need a forecast generated.
+        # Cached by data mtime like the forecast results.
+        cache_key = (os.stat(data_path).st_mtime_ns, 'models')
+        cached = _FORECAST_CACHE.get(cache_key)
+        if cached is not None:
+            models_info, success, message = cached, True, "Model information served from cache"
+        else:
+            models_info, success, message = load_and_train(data_path)
+            if success and models_info is not None:
+                if len(_FORECAST_CACHE) >= _FORECAST_CACHE_MAX_ENTRIES:
+                    _FORECAST_CACHE.clear()
+                _FORECAST_CACHE[cache_key] = models_info
+
+        if success and models_info is not None:
             return jsonify({
                 "success": True,
                 "message": "Model information retrieved successfully",
-                "data": forecast_results['models']
+                "data": models_info
             })
         else:
             return jsonify({